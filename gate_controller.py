@@ -2,7 +2,13 @@
 ====================
 
 Simple wrapper to open/close the ping pong feed gate via SerialController.
-Sends "G,1" for open and "G,0" for close.
+Sends "G,1" for open and "G,0" for close.  ``pulse()`` sends
+"GP,<ms>" so the firmware opens the gate and closes it again on its own
+timer – no host-side sleep between two commands.
+
+``open()`` and ``close()`` may be called from different threads (the GUI
+schedules the close on the Tk loop); that is safe because
+SerialController queues every write for its single writer thread.
 """
 
 from __future__ import annotations
@@ -15,8 +21,12 @@ class GateController:
 
     def open(self) -> None:
         """Command the gate to open."""
-        self.serial.write_raw("G,1\n")
+        self.serial.write_raw(b"G,1\n")
 
     def close(self) -> None:
         """Command the gate to close."""
-        self.serial.write_raw("G,0\n")
+        self.serial.write_raw(b"G,0\n")
+
+    def pulse(self, on_time: float) -> None:
+        """Open the gate for *on_time* seconds in a single command."""
+        self.serial.write_raw(b"GP,%d\n" % int(on_time * 1000))
@@ -2,27 +2,125 @@
 Simple Tkinter GUI for the ping‑pong launcher.
 
 Start  → begin pose tracking / angle streaming  
-Stop   → halt video thread and release the webcam  
+Stop   → halt the capture / pose / display threads and release the webcam  
 Follow / Random → aim modes  
 Flat / Top Spin / Back Spin → wheel presets
 """
 
 from __future__ import annotations
 
+import queue
 import threading
 import time
 import tkinter as tk
 from tkinter import ttk
 
 import cv2
+import numpy as np
 
 from pose_tracker import PoseTracker
 from servo_aim import ServoAimer, Mode
 from serial_controller import SerialController
 from gate_controller import GateController
 from wheel_controller import WheelController
-from utils import pad_square, find_camera_index, find_serial_port
-
+from utils import list_camera_indices, list_serial_ports
+
+# Smallest aim change (degrees) worth a serial transaction
+ANGLE_DEADBAND = 2
+
+# Depth of the pose→display queue (capture→pose holds only the latest
+# frame), and the most spare capture buffers kept around for reuse
+QUEUE_SIZE = 2
+FRAME_POOL_SIZE = 2 * QUEUE_SIZE + 3
+
+# How often the Tk thread repaints the preview (~30 FPS)
+PREVIEW_INTERVAL_MS = 33
+
+# Label refresh period for values coming from the workers (~10 Hz)
+UI_INTERVAL_MS = 100
+
+# Capture sizes offered in the GUI (applied on Start)
+RESOLUTIONS = ("320x240", "640x480", "1280x720")
+
+# Rows covered by the pre-rendered mode/spin HUD overlay
+HUD_HEIGHT = 100
+
+
+# ----------------------------------------------------------------------
+# Widget layout, built in one pass by LauncherGUI._build_widgets().
+#   (ttk class, attribute to keep it on, (row, column), options, grid opts)
+# String values of command / variable / textvariable and "<<Event>>" keys
+# name LauncherGUI attributes; ("method", *args) binds arguments.
+# ----------------------------------------------------------------------
+_BTN  = {"padx": 5, "pady": 5}
+_LBL  = {"padx": 5}
+_NAME = {"sticky": "e"}
+_WIDE = {"columnspan": 2, "sticky": "w"}
+
+WIDGETS = (
+    # --- start / stop ------------------------------------------------
+    ("Button", "start_btn", (0, 0), {"text": "Start", "command": "start"}, _BTN),
+    ("Button", "stop_btn",  (0, 1), {"text": "Stop",  "command": "stop"},  _BTN),
+    ("Label",  None,        (0, 2), {"textvariable": "angle_var"},         _LBL),
+
+    # --- aim mode ----------------------------------------------------
+    ("Button", None, (1, 0), {"text": "Follow", "command": ("_set_mode", Mode.FOLLOW)}, _BTN),
+    ("Button", None, (1, 1), {"text": "Random", "command": ("_set_mode", Mode.RANDOM)}, _BTN),
+    ("Label",  None, (1, 2), {"textvariable": "mode_var"}, _LBL),
+
+    # --- spin presets ------------------------------------------------
+    ("Button", None, (2, 0), {"text": "Flat",      "command": ("_set_spin", "flat")},     _BTN),
+    ("Button", None, (2, 1), {"text": "Top Spin",  "command": ("_set_spin", "topspin")},  _BTN),
+    ("Button", None, (2, 2), {"text": "Back Spin", "command": ("_set_spin", "backspin")}, _BTN),
+    ("Label",  None, (2, 3), {"textvariable": "spin_var"}, _LBL),
+
+    # --- PWM spinboxes -----------------------------------------------
+    ("Label",   None, (3, 0), {"text": "Upper PWM"}, _NAME),
+    ("Spinbox", None, (3, 1), {"from_": 0, "to": 255, "textvariable": "upper_pwm",
+                               "width": 5, "command": "_update_pwms"}, {}),
+    ("Label",   None, (4, 0), {"text": "Lower PWM"}, _NAME),
+    ("Spinbox", None, (4, 1), {"from_": 0, "to": 255, "textvariable": "lower_pwm",
+                               "width": 5, "command": "_update_pwms"}, {}),
+
+    # --- gate timing -------------------------------------------------
+    ("Label",   None, (5, 0), {"text": "Gate on time (s)"}, _NAME),
+    ("Spinbox", None, (5, 1), {"from_": 0.1, "to": 2.0, "increment": 0.1,
+                               "textvariable": "launch_on_time", "width": 5}, {}),
+    ("Label",   None, (6, 0), {"text": "Gate off time (s)"}, _NAME),
+    ("Spinbox", None, (6, 1), {"from_": 0.1, "to": 5.0, "increment": 0.1,
+                               "textvariable": "launch_off_time", "width": 5}, {}),
+
+    # --- processing rate ---------------------------------------------
+    ("Label",   None, (7, 0), {"text": "Target FPS"}, _NAME),
+    ("Spinbox", None, (7, 1), {"from_": 1, "to": 60, "textvariable": "target_fps",
+                               "width": 5}, {}),
+
+    # --- serial mode / preview toggles -------------------------------
+    ("Checkbutton", None, (8, 0), {"text": "Mock Serial", "variable": "mock_var",
+                                   "command": "_toggle_mock"}, _WIDE),
+    ("Checkbutton", None, (9, 0), {"text": "Show Preview", "variable": "show_preview"}, _WIDE),
+
+    # --- device selection (filled by _populate_dropdowns) ------------
+    ("Label",    None,       (10, 0), {"text": "Serial port"}, _NAME),
+    ("Combobox", "port_box", (10, 1), {"textvariable": "port_var", "state": "readonly",
+                                       "width": 12,
+                                       "<<ComboboxSelected>>": "_on_port_selected"}, _WIDE),
+    ("Label",    None,       (11, 0), {"text": "Camera"}, _NAME),
+    ("Combobox", "cam_box",  (11, 1), {"textvariable": "cam_var", "state": "readonly",
+                                       "width": 12,
+                                       "<<ComboboxSelected>>": "_on_cam_selected"}, _WIDE),
+    ("Label",    None,       (12, 0), {"text": "Resolution"}, _NAME),
+    ("Combobox", None,       (12, 1), {"textvariable": "resolution", "values": RESOLUTIONS,
+                                       "state": "readonly", "width": 12}, _WIDE),
+
+    # --- pose inference cadence --------------------------------------
+    ("Label",   None, (13, 0), {"text": "Pose FPS"}, _NAME),
+    ("Spinbox", None, (13, 1), {"from_": 1, "to": 60, "textvariable": "pose_fps",
+                                "width": 5}, {}),
+
+    # --- live preview (fed by _refresh_preview) ----------------------
+    ("Label", "preview_label", (0, 4), {}, {"rowspan": 14, "padx": 10, "sticky": "n"}),
+)
 
 
 class LauncherGUI:
@@ -31,7 +129,7 @@ class LauncherGUI:
     def __init__(
         self,
         *,
-        port: str = "COM5",
+        port: str | None = "COM5",
         mock_serial: bool = True,
         cam_index: int | None = None,       # None → auto‑detect
     ) -> None:
@@ -40,7 +138,8 @@ class LauncherGUI:
         Parameters
         ----------
         port:
-            Serial port for the Arduino.
+            Serial port for the Arduino, or ``None`` to pick one once the
+            background device scan has finished.
         mock_serial:
             If ``True`` use a mock serial connection. This can also be
             toggled later from the GUI.
@@ -53,10 +152,9 @@ class LauncherGUI:
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # -------- back‑end objects ------
-        if port is None:
-            port = find_serial_port() or "COM7"
-        self.serial = SerialController(port, mock=mock_serial)
-        self.serial.connect()
+        # Without a port we stay in mock mode until the device scan (or the
+        # user) picks one – see _on_port_selected().
+        self.serial = SerialController(port, mock=mock_serial or port is None)
 
         self.tracker = PoseTracker()
         self.aimer   = ServoAimer(mode=Mode.FOLLOW)
@@ -67,22 +165,80 @@ class LauncherGUI:
         self.cam_index = cam_index
         self.cap: cv2.VideoCapture | None = None
         self.running   = False
-        self.loop_thread: threading.Thread | None = None
+        self.threads: list[threading.Thread] = []
+        self._stop_evt = threading.Event()
+        self.frame_q: queue.Queue = queue.Queue(maxsize=1)
+        self.display_q: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._last_angle_sent: int | None = None
+        # raw angle + 90 -> servo-safe 0..180, replaces a clamp per frame
+        self._angle_lut = np.clip(np.arange(-90, 271), 0, 180).astype(np.uint8)
+        self._free_frames: queue.SimpleQueue = queue.SimpleQueue()
+        self._display_lock = threading.Lock()
+        self._display_frame: np.ndarray | None = None
+        self._photo: tk.PhotoImage | None = None
+        self._hud_overlay: np.ndarray | None = None
+        self._hud_dirty = True
+        # HUD strings are rebuilt only by _set_mode / _set_spin
+        self._mode_text = f"Mode:{self.aimer.mode}"
+        self._spin_text = f"Spin:{self.wheels.preset_name}"
 
         # -------- user‑tunable params ---
         self.upper_pwm       = tk.IntVar(value=140)
         self.lower_pwm       = tk.IntVar(value=140)
         self.launch_on_time  = tk.DoubleVar(value=0.3)
         self.launch_off_time = tk.DoubleVar(value=2.0)
+        self.target_fps      = tk.IntVar(value=15)
+        self.pose_fps        = tk.IntVar(value=15)
+        self.resolution      = tk.StringVar(value=RESOLUTIONS[1])
 
         # UI feedback vars
         self.mode_var  = tk.StringVar(value=str(self.aimer.mode))
-        self.spin_var  = tk.StringVar(value=self.wheels._preset.name)
+        self.spin_var  = tk.StringVar(value=self.wheels.preset_name)
         self.angle_var = tk.IntVar(value=0)
         self.mock_var  = tk.BooleanVar(value=mock_serial)
+        self.show_preview = tk.BooleanVar(value=True)
+        self.port_var  = tk.StringVar(value=port or "")
+        self.cam_var   = tk.StringVar(value="" if cam_index is None else str(cam_index))
+
+        # Plain‑Python mirrors of the Tk vars read by the worker threads;
+        # a Tcl round‑trip per frame is not free.
+        self._mirror(self.launch_on_time,  "_launch_on_time_cache")
+        self._mirror(self.launch_off_time, "_launch_off_time_cache")
+        self._mirror(self.target_fps,      "_target_fps_cache")
+        self._mirror(self.pose_fps,        "_pose_fps_cache")
+        self._mirror(self.show_preview,    "_show_preview_cache")
+        self._mirror(self.resolution,      "_resolution_cache")
+
+        # Worker threads park label updates here; _ui_tick() applies them
+        # on the Tk thread at a fixed, low rate.
+        self._ui_lock = threading.Lock()
+        self._pending_ui: dict[str, object] = {}
+        self._ui_vars: dict[str, tk.Variable] = {"angle": self.angle_var}
+        self._ui_shown: dict[str, object] = {}
 
         self._build_widgets()
 
+        # Probing serial ports / cameras can take seconds – do it off the
+        # Tk thread and fill the dropdowns when it is done.  Start waits
+        # for it, so capture never opens a camera the scan is probing.
+        self.start_btn.state(["disabled"])
+        threading.Thread(target=self._enumerate_devices, daemon=True).start()
+
+        self.root.after(PREVIEW_INTERVAL_MS, self._refresh_preview)
+        self.root.after(UI_INTERVAL_MS, self._ui_tick)
+
+    def _mirror(self, var: tk.Variable, attr: str) -> None:
+        """Keep ``self.<attr>`` in sync with *var* via a write trace."""
+        setattr(self, attr, var.get())
+
+        def _on_write(*_) -> None:
+            try:
+                setattr(self, attr, var.get())
+            except tk.TclError:
+                pass  # half‑typed spinbox entry – keep the last good value
+
+        var.trace_add("write", _on_write)
+
     # ------------------------------------------------------------------
     # GUI layout
     # ------------------------------------------------------------------
@@ -90,77 +246,143 @@ class LauncherGUI:
         frame = ttk.Frame(self.root, padding=10)
         frame.grid(row=0, column=0, sticky="nsew")
 
-        # --- start / stop ------------------------------------------------
-        self.start_btn = ttk.Button(frame, text="Start", command=self.start)
-        self.start_btn.grid(row=0, column=0, padx=5, pady=5)
-        self.stop_btn = ttk.Button(frame, text="Stop", command=self.stop)
-        self.stop_btn.grid(row=0, column=1, padx=5, pady=5)
+        for kind, name, (row, col), opts, grid in WIDGETS:
+            opts = dict(opts)
+            events = {k: opts.pop(k) for k in list(opts) if k.startswith("<<")}
+            for key in ("command", "variable", "textvariable"):
+                if key in opts:
+                    opts[key] = self._resolve(opts[key])
+
+            widget = getattr(ttk, kind)(frame, **opts)
+            widget.grid(row=row, column=col, **grid)
+            for event, handler in events.items():
+                widget.bind(event, self._resolve(handler))
+            if name:
+                setattr(self, name, widget)
+
         self.stop_btn.state(["disabled"])
-        ttk.Label(frame, textvariable=self.angle_var).grid(row=0, column=2, padx=5)
-
-        # --- aim mode ----------------------------------------------------
-        ttk.Button(frame, text="Follow",
-                   command=lambda: self._set_mode(Mode.FOLLOW)).grid(row=1, column=0, padx=5, pady=5)
-        ttk.Button(frame, text="Random",
-                   command=lambda: self._set_mode(Mode.RANDOM)).grid(row=1, column=1, padx=5, pady=5)
-        ttk.Label(frame, textvariable=self.mode_var).grid(row=1, column=2, padx=5)
-
-        # --- spin presets ------------------------------------------------
-        ttk.Button(frame, text="Flat",
-                   command=lambda: self._set_spin("flat")).grid(row=2, column=0, padx=5, pady=5)
-        ttk.Button(frame, text="Top Spin",
-                   command=lambda: self._set_spin("topspin")).grid(row=2, column=1, padx=5, pady=5)
-        ttk.Button(frame, text="Back Spin",
-                   command=lambda: self._set_spin("backspin")).grid(row=2, column=2, padx=5, pady=5)
-        ttk.Label(frame, textvariable=self.spin_var).grid(row=2, column=3, padx=5)
-
-        # --- PWM spinboxes -----------------------------------------------
-        ttk.Label(frame, text="Upper PWM").grid(row=3, column=0, sticky="e")
-        ttk.Spinbox(frame, from_=0, to=255, textvariable=self.upper_pwm,
-                    width=5, command=self._update_pwms).grid(row=3, column=1)
-        ttk.Label(frame, text="Lower PWM").grid(row=4, column=0, sticky="e")
-        ttk.Spinbox(frame, from_=0, to=255, textvariable=self.lower_pwm,
-                    width=5, command=self._update_pwms).grid(row=4, column=1)
-
-        # --- gate timing -------------------------------------------------
-        ttk.Label(frame, text="Gate on time (s)").grid(row=5, column=0, sticky="e")
-        ttk.Spinbox(frame, from_=0.1, to=2.0, increment=0.1,
-                    textvariable=self.launch_on_time, width=5).grid(row=5, column=1)
-        ttk.Label(frame, text="Gate off time (s)").grid(row=6, column=0, sticky="e")
-        ttk.Spinbox(frame, from_=0.1, to=5.0, increment=0.1,
-                    textvariable=self.launch_off_time, width=5).grid(row=6, column=1)
-
-        # --- serial mode toggle -------------------------------------------
-        ttk.Checkbutton(
-            frame,
-            text="Mock Serial",
-            variable=self.mock_var,
-            command=self._toggle_mock,
-        ).grid(row=7, column=0, columnspan=2, sticky="w")
+        self.root.update_idletasks()  # settle geometry once, not per widget
+
+    def _resolve(self, ref):
+        """Turn a WIDGETS reference into a bound attribute / callback.
+
+        ``"name"`` -> ``self.name``; ``("name", *args)`` -> a callback that
+        invokes ``self.name(*args)``.
+        """
+        if isinstance(ref, tuple):
+            method, *args = ref
+            return lambda: getattr(self, method)(*args)
+        return getattr(self, ref)
 
     # ------------------------------------------------------------------
     # Button callbacks
     # ------------------------------------------------------------------
+    def _render_hud(self, width: int) -> None:
+        """Rasterise the mode / spin HUD lines once into an overlay."""
+        # clear first: a _set_mode/_set_spin landing mid-render re-dirties it
+        self._hud_dirty = False
+        overlay = np.zeros((HUD_HEIGHT, width, 3), np.uint8)
+        cv2.putText(overlay, self._mode_text, (10, 25),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+        cv2.putText(overlay, self._spin_text, (10, 50),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+        self._hud_overlay = overlay
+
     def _update_pwms(self) -> None:
         self.wheels.set_base_pwms(self.upper_pwm.get(), self.lower_pwm.get())
 
     def _set_mode(self, mode: Mode) -> None:
         self.aimer.set_mode(mode)
         self.mode_var.set(str(mode))
+        self._mode_text = f"Mode:{mode}"
+        self._hud_dirty = True
         print(f"[GUI] Mode -> {mode}")
 
     def _set_spin(self, preset: str) -> None:
         self.wheels.set_spin(preset)
         self.spin_var.set(preset)
+        self._spin_text = f"Spin:{preset}"
+        self._hud_dirty = True
         print(f"[GUI] Spin -> {preset.upper()}")
 
     def _toggle_mock(self) -> None:
         """Callback to switch between mock and real serial mode."""
         use_mock = self.mock_var.get()
+        if not use_mock and not self.port_var.get():
+            print("[GUI] No serial port selected yet – staying in MOCK mode")
+            self.mock_var.set(True)  # keep the checkbox honest
+            return
         self.serial.set_mock(use_mock)
         state = "MOCK" if use_mock else "REAL"
         print(f"[GUI] Serial mode -> {state}")
 
+    def _on_port_selected(self, _event=None) -> None:
+        """Reconnect to the port chosen in the dropdown."""
+        port = self.port_var.get()
+        if not port or port == self.serial.port:
+            return
+        self.serial.set_mock(True)  # closes the old real port, if any
+        self.serial.port = port
+        self.serial.set_mock(self.mock_var.get())
+        print(f"[GUI] Serial port -> {port}")
+
+    def _on_cam_selected(self, _event=None) -> None:
+        self.cam_index = int(self.cam_var.get())
+        print(f"[GUI] Camera -> {self.cam_index} (applies on next Start)")
+
+    def _refresh_preview(self) -> None:
+        """Show the newest annotated frame in the Tk window (Tk thread)."""
+        with self._display_lock:
+            frame, self._display_frame = self._display_frame, None
+
+        if frame is not None and self._show_preview_cache:
+            # Tk reads binary PPM natively and imencode swaps BGR→RGB for
+            # us, so no extra imaging library is needed.
+            ok, ppm = cv2.imencode(".ppm", frame)
+            if ok:
+                self._photo = tk.PhotoImage(data=ppm.tobytes())
+                self.preview_label.configure(image=self._photo)
+        elif not self._show_preview_cache and self._photo is not None:
+            self.preview_label.configure(image="")
+            self._photo = None
+        if frame is not None:
+            self._recycle(frame)  # end of the line for this capture buffer
+
+        self.root.after(PREVIEW_INTERVAL_MS, self._refresh_preview)
+
+    def _ui_tick(self) -> None:
+        """Apply label updates queued by the worker threads (Tk thread)."""
+        with self._ui_lock:
+            pending, self._pending_ui = self._pending_ui, {}
+        for key, value in pending.items():
+            if self._ui_shown.get(key) != value:
+                self._ui_vars[key].set(value)
+                self._ui_shown[key] = value
+
+        self.root.after(UI_INTERVAL_MS, self._ui_tick)
+
+    # ------------------------------------------------------------------
+    # Device discovery (runs in background thread)
+    # ------------------------------------------------------------------
+    def _enumerate_devices(self) -> None:
+        ports = list_serial_ports()
+        cams = list_camera_indices()
+        self.root.after(0, self._populate_dropdowns, ports, cams)
+
+    def _populate_dropdowns(self, ports: list[str], cams: list[int]) -> None:
+        self.port_box["values"] = ports
+        self.cam_box["values"] = [str(c) for c in cams]
+
+        # keep explicit choices; otherwise take the best guess
+        if not self.port_var.get() and ports:
+            self.port_var.set(ports[0])
+            self._on_port_selected()
+        if self.cam_index is None:
+            self.cam_index = cams[0] if cams else 0
+            self.cam_var.set(str(self.cam_index))
+        if not self.running:
+            self.start_btn.state(["!disabled"])
+
     # ------------------------------------------------------------------
     # Lifecycle controls
     # ------------------------------------------------------------------
@@ -170,85 +392,228 @@ class LauncherGUI:
         self.running = True
         self.start_btn.state(["disabled"])
         self.stop_btn.state(["!disabled"])
-        self.loop_thread = threading.Thread(target=self._loop, daemon=True)
-        self.loop_thread.start()
+
+        # fresh queues each run so no stale frames survive a restart
+        self._last_angle_sent = None
+        self._stop_evt.clear()
+        self.frame_q   = queue.Queue(maxsize=1)
+        self.display_q = queue.Queue(maxsize=QUEUE_SIZE)
+        self.threads = [
+            threading.Thread(target=target, daemon=True)
+            for target in (self._capture_loop, self._process_loop, self._display_loop)
+        ]
+        for t in self.threads:
+            t.start()
 
     def stop(self) -> None:
         self.running = False
+        self._stop_evt.set()
         self.start_btn.state(["!disabled"])
         self.stop_btn.state(["disabled"])
-        if self.loop_thread and threading.current_thread() is not self.loop_thread:
-            self.loop_thread.join(timeout=1.0)
-            self.loop_thread = None
+        current = threading.current_thread()
+        for t in self.threads:
+            if t is not current:
+                t.join(timeout=1.0)
+        self.threads = []
 
     def _on_close(self) -> None:
-        self.stop()
+        self.stop()          # the display stage closes a pending gate
+        self.serial.close()  # writer thread drains the queue first
         self.root.destroy()
 
     # ------------------------------------------------------------------
-    # Video / pose loop (runs in background thread)
+    # Queue helpers – block for back‑pressure but wake up on stop()
     # ------------------------------------------------------------------
-    def _loop(self) -> None:
-        # camera selection
-        cam = self.cam_index if self.cam_index is not None else (find_camera_index() or 0)
+    def _put(self, q: queue.Queue, item) -> bool:
+        while not self._stop_evt.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _put_latest(self, q: queue.Queue, frame: np.ndarray) -> None:
+        """Replace whatever is queued with *frame* – never blocks.
+
+        Used between capture and pose: when inference falls behind we want
+        the newest frame, not a backlog of stale ones.
+        """
+        try:
+            self._recycle(q.get_nowait())
+        except queue.Empty:
+            pass
+        q.put_nowait(frame)
+
+    def _recycle(self, frame: np.ndarray) -> None:
+        """Hand a capture buffer back once no stage needs it any more."""
+        if self._free_frames.qsize() < FRAME_POOL_SIZE:
+            self._free_frames.put(frame)
+
+    def _get(self, q: queue.Queue):
+        while not self._stop_evt.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    # ------------------------------------------------------------------
+    # Pipeline stages (each runs in its own background thread)
+    #   capture → frame_q → pose/aim → display_q → display/serial/launch
+    # ------------------------------------------------------------------
+    def _capture_loop(self) -> None:
+        # camera selection – set by the device scan, which Start waits for
+        cam = self.cam_index if self.cam_index is not None else 0
         self.cap = cv2.VideoCapture(cam)
+        # Keep the driver queue at one frame so the pose tracker never works
+        # on stale images; MJPG is far cheaper to decode than raw/H.264.
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        # MediaPipe downsizes internally anyway – don't pay for 1080p decode
+        width, height = (int(v) for v in self._resolution_cache.split("x"))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
         if not self.cap.isOpened():
             print("[GUI] Cannot open camera.")
             self.running = False
+            self._stop_evt.set()
             return
         print(f"[GUI] Using camera {cam}")
 
-        window_name = "Launcher Preview"
-        cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
-
-        last_launch = time.time()
+        # Only decode every *stride*-th frame; grab() on the rest just
+        # advances the stream without paying for the BGR conversion.
+        cam_fps = self.cap.get(cv2.CAP_PROP_FPS) or 30
+        stride = max(1, int(cam_fps // max(1, self._target_fps_cache)))
+        frame_idx = 0
 
-        while self.running:
-            ok, frame = self.cap.read()
+        # Decode into recycled buffers instead of a fresh array per frame.
+        # The pool starts empty and fills as later stages hand frames back.
+        while not self._stop_evt.is_set():
+            if not self.cap.grab():
+                break
+            frame_idx += 1
+            if frame_idx % stride:
+                continue
+            try:
+                ok, frame = self.cap.retrieve(self._free_frames.get_nowait())
+            except queue.Empty:
+                ok, frame = self.cap.retrieve()
             if not ok:
                 break
+            self._put_latest(self.frame_q, frame)
+
+        # Cleanup – a dead camera takes the rest of the pipeline down too
+        self.cap.release()
+        self.running = False
+        self._stop_evt.set()
+
+    def _process_loop(self) -> None:
+        next_infer = 0.0
+        waist_xy = None
+
+        while True:
+            frame = self._get(self.frame_q)
+            if frame is None:
+                break
+
+            # Aim in the coordinates of a square frame without padding
+            # one: the tracker just offsets the waist by the virtual border.
+            h, w = frame.shape[:2]
+            side = max(h, w)
 
-            frame = pad_square(frame)
-            waist_xy, annotated = self.tracker.process(frame)
+            # MediaPipe runs at its own fixed cadence (and not at all in
+            # RANDOM mode); frames in between reuse the last waist.  The
+            # deadline accepts frames up to half a period early, so camera
+            # jitter can't halve the rate when both FPS settings match.
+            now = time.time()
+            period = 1.0 / max(1, self._pose_fps_cache)
+            if (self.aimer.mode == Mode.FOLLOW
+                    and now >= next_infer - 0.5 * period):
+                # with the preview off nobody sees the skeleton
+                waist_xy, annotated = self.tracker.process(
+                    frame, (side - w) // 2, (side - h) // 2,
+                    draw=self._show_preview_cache,
+                )
+                next_infer += period
+                if next_infer < now:  # fell behind (or first frame) – resync
+                    next_infer = now
+            else:
+                if self.aimer.mode != Mode.FOLLOW:
+                    # FOLLOW must not resume on pre-RANDOM landmarks
+                    self.tracker.reset()
+                    waist_xy = None
+                annotated = frame
 
             # ------- aim + arrow ------------------------------------
             angle = self.aimer.update(
                 waist_xy[0] if waist_xy else None,
-                annotated.shape[1],
+                side,
             )
-            self.serial.write_angle(angle)
-            self.angle_var.set(angle)
-            self.aimer.draw_arrow(
-                annotated,
-                annotated.shape[1] // 2,
-                annotated.shape[0] - 40,
-            )
-
-            # HUD overlays
-            cv2.putText(annotated, f"Mode:{self.aimer.mode}", (10, 25),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-            cv2.putText(annotated, f"Spin:{self.wheels._preset.name}", (10, 50),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-            cv2.putText(annotated, f"Ang:{angle}", (10, 75),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-
-            cv2.imshow(window_name, annotated)
-            cv2.waitKey(1)
+            self.aimer.draw_arrow(annotated, w // 2, h - 40)
+            self._put(self.display_q, (annotated, angle))
+
+    def _display_loop(self) -> None:
+        last_launch = time.time()    # when the gate last closed
+        gate_close_at: float | None = None
+
+        while not self._stop_evt.is_set():
+            # poll tighter while a close is due so the on-time stays exact
+            try:
+                item = self.display_q.get(timeout=0.01 if gate_close_at else 0.1)
+            except queue.Empty:
+                item = None
+
+            # pending gate close – a deadline checked here instead of a
+            # sleep or a Tk callback, so frames keep draining meanwhile
+            now = time.time()
+            if gate_close_at is not None and now >= gate_close_at:
+                self.gate.close()
+                gate_close_at = None
+                last_launch = now
+            if item is None:
+                continue
+            annotated, angle = item
+            angle = int(self._angle_lut[angle + 90])
+
+            # only bother the Arduino when the aim actually moved
+            if self._last_angle_sent is None or abs(angle - self._last_angle_sent) >= ANGLE_DEADBAND:
+                self.serial.write_angle(angle)
+                self._last_angle_sent = angle
+            with self._ui_lock:
+                self._pending_ui["angle"] = angle
+
+            # HUD + preview are skipped entirely when nobody is watching.
+            # The frame is only handed over here – Tk draws it on its own
+            # thread in _refresh_preview().
+            if self._show_preview_cache:
+                # static lines come from a pre-rendered overlay; only the
+                # angle is rasterised per frame
+                w = annotated.shape[1]
+                if self._hud_dirty or self._hud_overlay is None or self._hud_overlay.shape[1] != w:
+                    self._render_hud(w)
+                roi = annotated[:HUD_HEIGHT, :w]
+                np.maximum(roi, self._hud_overlay, out=roi)
+                cv2.putText(annotated, f"Ang:{angle}", (10, 75),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+
+                with self._display_lock:
+                    stale, self._display_frame = self._display_frame, annotated
+                if stale is not None:
+                    self._recycle(stale)  # Tk never got round to this one
+            else:
+                self._recycle(annotated)
 
             # ------- timed launch routine ---------------------------
-            now = time.time()
-            if now - last_launch >= self.launch_off_time.get():
+            # off-time counts from the close, and no shot while one is open
+            if gate_close_at is None and now - last_launch >= self._launch_off_time_cache:
                 self.wheels.fire()
                 self.gate.open()
-                time.sleep(self.launch_on_time.get())
-                self.gate.close()
-                last_launch = time.time()
+                gate_close_at = now + self._launch_on_time_cache
 
-        # Cleanup ----------------------------------------------------
-        if self.cap:
-            self.cap.release()
-        cv2.destroyWindow(window_name)
-        self.loop_thread = None
+        # pipeline stopped mid-shot – never leave the gate open
+        if gate_close_at is not None:
+            self.gate.close()
 
     # ------------------------------------------------------------------
     def run(self) -> None:
@@ -14,15 +14,16 @@ Use --[no-]mock to enable or disable mock serial mode.
 """
 
 from __future__ import annotations
-import argparse, time
+import argparse, queue, sys, threading, time
 import cv2
+import numpy as np
 
 from pose_tracker import PoseTracker
 from servo_aim import ServoAimer, Mode
 from serial_controller import SerialController
 from gate_controller import GateController
-from utils import pad_square, find_camera_index, find_serial_port
-from collections import deque
+from utils import SquarePadder, find_camera_index, find_serial_port, grab_latest
+from collections import OrderedDict
 
 # ------------------------------------------------ Argument flag
 parser = argparse.ArgumentParser()
@@ -49,21 +50,57 @@ parser.add_argument(
 args = parser.parse_args()
 
 # ------------------------------------------------ Config
-WEBCAM_INDEX = find_camera_index() or 0
 FRAME_W, FRAME_H, FPS = 640, 480, 30
-ARDUINO_PORT = args.port or find_serial_port() or "COM5"
 WINDOW_NAME  = "Ping-Pong Servo Aimer"
+STEADY_FRAMES = 5  # identical aim angles in a row before a shot is allowed
+GATE_OPEN_S  = 0.3  # how long the feed gate stays open per shot
+POSE_SKIP    = 2   # run MediaPipe on every 2nd frame, hold landmarks between
+HUD_W, HUD_H = 200, 120
+HUD_CACHE_SIZE = 64
+
+# ------------------------------------------------ HUD tiles
+# The HUD text only changes when angle/fps/mode/spin do, so each distinct
+# combination is rasterised once and pasted afterwards (LRU-capped).
+_hud_cache: OrderedDict = OrderedDict()
+
+def hud_tile(angle: int, fps: int, mode: str, spin: str | None):
+    """Return ``(tile, mask)`` for this HUD state, rendering it on a miss."""
+    key = (angle, fps, mode, spin)
+    hit = _hud_cache.get(key)
+    if hit is not None:
+        _hud_cache.move_to_end(key)
+        return hit
+
+    tile = np.zeros((HUD_H, HUD_W, 3), np.uint8)
+    cv2.putText(tile, f"Aim:{angle}", (10, 25),
+                cv2.FONT_HERSHEY_SIMPLEX, .7, (255, 255, 0), 2)
+    cv2.putText(tile, f"FPS:{fps}", (10, 50),
+                cv2.FONT_HERSHEY_SIMPLEX, .7, (255, 255, 0), 2)
+    cv2.putText(tile, f"Mode:{mode}", (10, 75),
+                cv2.FONT_HERSHEY_SIMPLEX, .7, (200, 255, 0), 2)
+    if spin is not None:
+        cv2.putText(tile, f"Spin:{spin}", (10, 100),
+                    cv2.FONT_HERSHEY_SIMPLEX, .7, (200, 255, 0), 2)
+
+    hit = _hud_cache[key] = (tile, tile.any(axis=2, keepdims=True))
+    if len(_hud_cache) > HUD_CACHE_SIZE:
+        _hud_cache.popitem(last=False)
+    return hit
 
 # ------------------------------------------------ Main
 def main() -> None:
     if args.gui:
         from launcher_gui import LauncherGUI
-        gui = LauncherGUI(port=ARDUINO_PORT, mock_serial=args.mock)
+        # the GUI scans devices itself, off the Tk thread
+        gui = LauncherGUI(port=args.port, mock_serial=args.mock)
         gui.run()
         return
 
-    ser = SerialController(ARDUINO_PORT, mock=args.mock)
-    ser.connect()
+    # device probes can take seconds – only the CLI waits for them
+    webcam_index = find_camera_index() or 0
+    arduino_port = args.port or find_serial_port() or "COM5"
+
+    ser = SerialController(arduino_port, mock=args.mock)  # connects itself
 
     # optional wheel controller
     if args.spin:
@@ -71,21 +108,20 @@ def main() -> None:
         wheels = WheelController(ser, preset="flat")
         gate = GateController(ser)
 
-    cap = cv2.VideoCapture(WEBCAM_INDEX)
+    cap = cv2.VideoCapture(webcam_index)
     if not cap.isOpened():
         print("[Main] Cannot open camera.")
         return
-    print(f"[Main] Using camera {WEBCAM_INDEX}")
+    print(f"[Main] Using camera {webcam_index}")
     cap.set(cv2.CAP_PROP_FRAME_WIDTH,  FRAME_W)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_H)
     cap.set(cv2.CAP_PROP_FPS, FPS)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # honoured by V4L2 / DirectShow
 
-    cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_NORMAL)
-    cv2.resizeWindow(WINDOW_NAME, FRAME_W, FRAME_W)
-
-    tracker = PoseTracker()
+    tracker = PoseTracker(skip=POSE_SKIP)
     aimer   = ServoAimer(mode=Mode.FOLLOW)
-    angle_buffer = deque(maxlen=5)
+    # length of the current run of identical angles – "steady" gate for firing
+    steady_count, last_angle = 0, None
 
     print("[Main] q=quit  m=mode", end="")
     if args.spin:
@@ -93,37 +129,147 @@ def main() -> None:
     else:
         print("  (run with --spin to enable wheel control)")
 
+    # ---------------- capture + pose producer thread
+    # The worker owns cap/tracker and publishes its newest result in a
+    # single slot; the main thread only aims, draws and polls keys.
+    lock     = threading.Lock()
+    latest   = {"seq": 0, "waist": None, "frame": None}
+    stop_evt = threading.Event()
+    # cleared while the window is minimised/hidden – skip skeleton drawing
+    visible  = threading.Event(); visible.set()
+
+    def producer() -> None:
+        padder = None  # built from the first frame, reused afterwards
+        # decode targets, reused round-robin so retrieve() never allocates;
+        # as many as the padder keeps, since a square frame passes through
+        bufs, slot = [None] * 4, 0
+        retrieve, process = cap.retrieve, tracker.process
+        while not stop_evt.is_set():
+            # skip anything that queued up while we were inferring
+            if not grab_latest(cap):
+                break
+            ok, frame = retrieve(bufs[slot])
+            if not ok:
+                break
+            bufs[slot] = frame  # retrieve() reallocates on a size change
+            slot = (slot + 1) % len(bufs)
+            h, w = frame.shape[:2]
+            if padder is None or padder.shape != (h, w):
+                # one canvas per stage that may still hold a frame
+                padder = SquarePadder(h, w, buffers=4)
+            if aimer.mode == Mode.FOLLOW:
+                # MediaPipe gets the native frame; the waist is shifted
+                # into square-frame coordinates instead of padding first
+                side = max(h, w)
+                waist_xy, annotated = process(
+                    frame, (side - w) // 2, (side - h) // 2,
+                    draw=visible.is_set(),
+                )
+            else:
+                # RANDOM aim ignores the player – don't pay for inference,
+                # and don't let FOLLOW resume on pre-RANDOM landmarks
+                tracker.reset()
+                waist_xy, annotated = None, frame
+            annotated = padder(annotated)  # square only for display
+            with lock:
+                latest["seq"] += 1
+                latest["waist"], latest["frame"] = waist_xy, annotated
+        stop_evt.set()
+
+    worker = threading.Thread(target=producer, daemon=True)
+    worker.start()
+
+    # ---------------- display thread
+    # imshow/waitKey get their own thread so window compositing never
+    # holds up aiming; keys come back through key_q.  macOS only allows
+    # HighGUI calls on the main thread, so there we stay inline.
+    threaded_display = sys.platform != "darwin"
+    show_q: queue.Queue = queue.Queue(maxsize=1)
+    key_q:  queue.Queue = queue.Queue()
+
+    def open_window() -> None:
+        cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_NORMAL)
+        cv2.resizeWindow(WINDOW_NAME, FRAME_W, FRAME_W)
+
+    def poll_visible() -> None:
+        # HighGUI call, so it runs wherever waitKey does
+        if cv2.getWindowProperty(WINDOW_NAME, cv2.WND_PROP_VISIBLE) < 1:
+            visible.clear()
+        else:
+            visible.set()
+
+    def display() -> None:
+        open_window()
+        while not stop_evt.is_set():
+            try:
+                cv2.imshow(WINDOW_NAME, show_q.get(timeout=0.02))
+            except queue.Empty:
+                pass
+            key = cv2.waitKey(1) & 0xFF
+            if key != 0xFF:
+                key_q.put(key)
+            poll_visible()
+        cv2.destroyAllWindows()
+
+    if threaded_display:
+        shower = threading.Thread(target=display, daemon=True)
+        shower.start()
+    else:
+        open_window()
+
+    seen = 0
     prev = time.time()
-    while True:
-        ok, frame = cap.read()
-        if not ok:
-            break
+    gate_close_at: float | None = None
+    # per-frame callables as locals (LOAD_FAST instead of attribute lookups)
+    _update, _write_angle, _draw_arrow = aimer.update, ser.write_angle, aimer.draw_arrow
+    _time, _monotonic, _copyto = time.time, time.monotonic, np.copyto
+    while not stop_evt.is_set():
+        with lock:
+            seq, waist_xy, annotated = latest["seq"], latest["waist"], latest["frame"]
 
-        frame = pad_square(frame)
-        h, w = frame.shape[:2]
+        if seq != seen:
+            seen = seq
+            h, w = annotated.shape[:2]
 
-        waist_xy, annotated = tracker.process(frame)
-        waist_x = waist_xy[0] if waist_xy else None
-        angle   = aimer.update(waist_x, w)
-        ser.write_angle(angle)
-        angle_buffer.append(angle)
+            waist_x = waist_xy[0] if waist_xy else None
+            angle   = _update(waist_x, w)
+            _write_angle(angle)
+            steady_count = steady_count + 1 if angle == last_angle else 1
+            last_angle = angle
 
-        aimer.draw_arrow(annotated, w // 2, h - 40)
+            _draw_arrow(annotated, w // 2, h - 40)
 
-        # HUD
-        fps = 1 / (time.time() - prev); prev = time.time()
-        cv2.putText(annotated, f"Aim:{angle}", (10, 25),
-                    cv2.FONT_HERSHEY_SIMPLEX, .7, (255, 255, 0), 2)
-        cv2.putText(annotated, f"FPS:{int(fps)}", (10, 50),
-                    cv2.FONT_HERSHEY_SIMPLEX, .7, (255, 255, 0), 2)
-        cv2.putText(annotated, f"Mode:{aimer.mode}", (10, 75),
-                    cv2.FONT_HERSHEY_SIMPLEX, .7, (200, 255, 0), 2)
-        if args.spin:
-            cv2.putText(annotated, f"Spin:{wheels._preset.name}", (10, 100),
-                        cv2.FONT_HERSHEY_SIMPLEX, .7, (200, 255, 0), 2)
+            # HUD
+            now = _time()
+            fps = 1 / (now - prev); prev = now
+            tile, mask = hud_tile(angle, int(fps), aimer.mode,
+                                  wheels.preset_name if args.spin else None)
+            _copyto(annotated[:HUD_H, :HUD_W], tile, where=mask)
+
+            if threaded_display:
+                # newest frame wins; an unshown older one is dropped
+                try:
+                    show_q.get_nowait()
+                except queue.Empty:
+                    pass
+                show_q.put_nowait(annotated)
+            else:
+                cv2.imshow(WINDOW_NAME, annotated)
 
-        cv2.imshow(WINDOW_NAME, annotated)
-        key = cv2.waitKey(1) & 0xFF
+        # pending gate close – checked each pass instead of sleeping
+        if gate_close_at is not None and _monotonic() >= gate_close_at:
+            gate.close()
+            gate_close_at = None
+
+        # keys are polled every pass, new frame or not
+        if threaded_display:
+            try:
+                key = key_q.get(timeout=0.005)
+            except queue.Empty:
+                key = 0xFF
+        else:
+            key = cv2.waitKey(1) & 0xFF
+            poll_visible()
 
         if   key == ord("q"):
             break
@@ -141,17 +287,23 @@ def main() -> None:
             elif key == ord("f"):
                 wheels.set_spin("flat");     print("[Main] Flat shot armed")
             elif key == ord(" "):
-                if len(angle_buffer) == angle_buffer.maxlen and len(set(angle_buffer)) == 1:
+                if steady_count >= STEADY_FRAMES:
                     wheels.fire()
                     gate.open()
-                    time.sleep(0.3)
-                    gate.close()
+                    gate_close_at = time.monotonic() + GATE_OPEN_S
                     print("[Main] FIRE!")
                 else:
                     print("[Main] Hold steady to fire")
 
     # tidy-up
-    cap.release(); cv2.destroyAllWindows()
+    if gate_close_at is not None:
+        gate.close()
+    stop_evt.set(); worker.join(timeout=1.0)
+    if threaded_display:
+        shower.join(timeout=1.0)
+    else:
+        cv2.destroyAllWindows()
+    cap.release()
     tracker.close(); ser.close()
 
 if __name__ == "__main__":
@@ -15,25 +15,41 @@ from typing import Optional, Tuple
 
 import cv2
 import mediapipe as mp
+import numpy as np
 
 # ----------------------------------------------------------------------
 # Constants – keeping them here means `main.py` stays clutter‑free
 # ----------------------------------------------------------------------
 MIN_DET_CONF = 0.5
 MIN_TRK_CONF = 0.5
+INFER_SIZE = 256  # longest side fed to MediaPipe – it resizes to ~256 anyway
 LEFT_HIP = mp.solutions.pose.PoseLandmark.LEFT_HIP
 RIGHT_HIP = mp.solutions.pose.PoseLandmark.RIGHT_HIP
+CV_THREADS = 2  # OpenCV's per-call pool; MediaPipe runs its own threads
+
+# cvtColor/resize on a 640x480 frame is too little work to fan out over
+# every core, and the extra workers only compete with MediaPipe.  Set here
+# so the CLI and the GUI (whichever entry point) both get it.
+cv2.setNumThreads(CV_THREADS)
 
 
 class PoseTracker:
     """Handles setup, frame processing and clean‑up for MediaPipe Pose."""
 
-    def __init__(self) -> None:
+    def __init__(self, skip: int = 1) -> None:
+        """*skip* = K runs MediaPipe on every K‑th frame only; the frames in
+        between reuse the previous landmarks (BlazePose‑style frame skip).
+        """
+        self.skip = max(1, skip)
+        self._frame_idx = 0
+        self._last_landmarks = None
+        self._rgb_buf: Optional[np.ndarray] = None  # reused cvtColor output
+
         self._mp_pose = mp.solutions.pose
         self._pose = self._mp_pose.Pose(
             static_image_mode=False,
             model_complexity=0,
-            smooth_landmarks=True,
+            smooth_landmarks=False,  # ServoAimer filters the waist itself
             enable_segmentation=False,
             min_detection_confidence=MIN_DET_CONF,
             min_tracking_confidence=MIN_TRK_CONF,
@@ -42,40 +58,80 @@ class PoseTracker:
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def process(self, frame) -> Tuple[Optional[Tuple[int, int]], cv2.Mat]:
+    def process(
+        self,
+        frame,
+        x_off: int = 0,
+        y_off: int = 0,
+        draw: bool = True,
+    ) -> Tuple[Optional[Tuple[int, int]], cv2.Mat]:
         """Run pose detection on *frame*.
 
         Returns (waist_xy, annotated_frame).
         *waist_xy* is (x, y) in pixel coords or None when no person is found.
+
+        *x_off* / *y_off* describe a *virtual* border around *frame*: the
+        returned waist is shifted by them, so callers can work in the
+        coordinates of a padded (e.g. square) frame without ever building
+        it.  Drawing on *annotated_frame* always uses native coordinates.
+
+        Note: *annotated_frame* **is** *frame* – the skeleton is drawn in
+        place to save a full‑frame copy.  Copy *frame* first if you still
+        need the clean image.  Pass ``draw=False`` when nobody is watching
+        to skip the skeleton and waist marker altogether.
         """
-        # MediaPipe needs RGB, OpenCV gives BGR
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        res = self._pose.process(rgb)
-        annotated = frame.copy()
+        # Skipped frames reuse the last landmarks; with nobody in view we
+        # detect every frame so the player is picked up again quickly.
+        if self._frame_idx % self.skip == 0 or self._last_landmarks is None:
+            # Shrink first (aspect kept): landmarks come back normalised, so
+            # they still map onto the full-size frame, and cvtColor plus
+            # MediaPipe's own preprocessing see far fewer pixels.
+            h, w = frame.shape[:2]
+            scale = INFER_SIZE / max(h, w)
+            small = frame
+            if scale < 1.0:
+                small = cv2.resize(frame, (round(w * scale), round(h * scale)),
+                                   interpolation=cv2.INTER_AREA)
+            # MediaPipe needs RGB, OpenCV gives BGR.  Convert into a buffer
+            # we keep between frames (a contiguous array, unlike [..., ::-1]).
+            if self._rgb_buf is None or self._rgb_buf.shape != small.shape:
+                self._rgb_buf = np.empty_like(small)
+            cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            self._last_landmarks = self._pose.process(self._rgb_buf).pose_landmarks
+        self._frame_idx += 1
+        landmarks = self._last_landmarks
+        annotated = frame  # drawn on in place, see docstring
 
         waist_xy: Optional[Tuple[int, int]] = None
-        if res.pose_landmarks:
+        if landmarks:
             # Draw the skeleton for visual feedback
-            mp.solutions.drawing_utils.draw_landmarks(
-                annotated,
-                res.pose_landmarks,
-                self._mp_pose.POSE_CONNECTIONS,
-            )
-
-            l_hip = res.pose_landmarks.landmark[LEFT_HIP]
-            r_hip = res.pose_landmarks.landmark[RIGHT_HIP]
+            if draw:
+                mp.solutions.drawing_utils.draw_landmarks(
+                    annotated,
+                    landmarks,
+                    self._mp_pose.POSE_CONNECTIONS,
+                )
+
+            l_hip = landmarks.landmark[LEFT_HIP]
+            r_hip = landmarks.landmark[RIGHT_HIP]
             h, w = annotated.shape[:2]
             waist_xy = (
                 int((l_hip.x + r_hip.x) / 2 * w),
                 int((l_hip.y + r_hip.y) / 2 * h),
             )
-            cv2.circle(annotated, waist_xy, 5, (0, 0, 255), -1)
+            if draw:
+                cv2.circle(annotated, waist_xy, 5, (0, 0, 255), -1)
+            waist_xy = (waist_xy[0] + x_off, waist_xy[1] + y_off)
 
         return waist_xy, annotated
 
     # ------------------------------------------------------------------
     # House‑keeping
     # ------------------------------------------------------------------
+    def reset(self):
+        """Forget held landmarks so the next process() call detects afresh."""
+        self._last_landmarks = None
+
     def close(self):
         """Free MediaPipe resources."""
         self._pose.close()
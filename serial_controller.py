@@ -13,10 +13,16 @@ Key features
 • Dynamic `set_mock(True|False)` lets you flip modes at runtime.
 • All real‑port errors gracefully fall back to mock mode, so the GUI
   never dies if you forget to plug the USB cable.
+• Outgoing bytes go through a queue drained by a writer thread, so a
+  slow or flow‑controlled port never stalls the video loop.
+• Arduino replies are informational only; they are echoed solely when
+  `echo_acks=True` (handy when debugging the sketch).
 """
 
 from __future__ import annotations
 
+import queue
+import threading
 import time
 from typing import Optional, Union
 
@@ -38,6 +44,11 @@ class _NullSerial:
     def readline(self) -> bytes:  # noqa: D401 – always returns empty
         return b""
 
+    def read(self, *_: int) -> bytes:  # noqa: D401 – always returns empty
+        return b""
+
+    in_waiting = 0
+
     @property
     def is_open(self) -> bool:  # noqa: D401 – always open
         return True
@@ -59,12 +70,17 @@ class SerialController:
         *,
         mock: bool = False,
         timeout: float = 1.0,
+        echo_acks: bool = False,
     ) -> None:
         self.port = port or "COM1"  # default keeps tests happy
         self.baud = baud
         self.timeout = timeout
+        self.echo_acks = echo_acks  # read + print Arduino replies
         self._mock = mock or serial is None
         self._ser: SerialLike = _NullSerial()
+        self._tx_q: queue.Queue = queue.Queue()
+        self._writer_thread: threading.Thread | None = None
+        self._last_angle: int | None = None  # last angle actually sent
 
         if not self._mock:
             self.connect()
@@ -91,9 +107,12 @@ class SerialController:
         if serial is None:
             raise RuntimeError("pyserial is not installed; cannot open real port")
 
+        self._stop_writer()
+        self._last_angle = None  # fresh link – resend the next angle
         try:
             self._ser = serial.Serial(self.port, self.baud, timeout=self.timeout)
             time.sleep(2)  # allow the Arduino's auto‑reset to finish
+            self._start_writer()
             print(f"[Serial] Connected to {self.port} @ {self.baud} baud.")
         except Exception as exc:
             print(f"[Serial] ERROR opening {self.port}: {exc}\n"
@@ -102,6 +121,7 @@ class SerialController:
             self._mock = True
 
     def close(self) -> None:
+        self._stop_writer()  # flushes anything still queued
         if hasattr(self._ser, "close"):
             self._ser.close()
             print("[Serial] Port closed.")
@@ -121,44 +141,88 @@ class SerialController:
     # ------------------------------------------------------------------
     # Internal (private) helpers
     # ------------------------------------------------------------------
-    def _tx(self, text: str) -> None:
-        """Low‑level transmitter – handles mock and real ports."""
+    def _start_writer(self) -> None:
+        self._tx_q = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._drain_tx, args=(self._tx_q, self._ser), daemon=True,
+        )
+        self._writer_thread.start()
+
+    def _stop_writer(self) -> None:
+        if self._writer_thread is None:
+            return
+        self._tx_q.put(None)  # sentinel – writer exits after the backlog
+        self._writer_thread.join(timeout=1.0)
+        self._writer_thread = None
+
+    @staticmethod
+    def _drain_tx(q: queue.Queue, ser: SerialLike) -> None:
+        """Writer thread body – the only place that touches ``ser.write``."""
+        while True:
+            data = q.get()
+            if data is None:
+                return
+            try:
+                ser.write(data)
+            except Exception as exc:
+                print(f"[Serial] ERROR writing to port: {exc}")
+
+    def _tx(self, data: str | bytes) -> None:
+        """Low‑level transmitter – handles mock and real ports.
+
+        Never blocks on the port: real writes are queued for the writer
+        thread.  Hot paths pass ready‑made bytes to skip the encode.
+        """
         if self._mock:
-            print(f"[Serial] MOCK -> {text.strip()}")
+            if isinstance(data, bytes):
+                data = data.decode(errors="backslashreplace")  # binary frames
+            print(f"[Serial] MOCK -> {data.strip()}")
         else:
-            self._ser.write(text.encode())
+            self._tx_q.put(data if isinstance(data, bytes) else data.encode())
 
     def _rx(self) -> str:
-        """Low‑level receiver – returns '' in mock mode."""
+        """Low‑level receiver – returns '' in mock mode.
+
+        Only reads what is already buffered, so it never waits on the
+        Arduino (a blocking readline() could stall up to *timeout*).
+        """
         if self._mock:
             return ""
-        self._ser.flush()
-        return self._ser.readline().decode(errors="ignore").strip()
+        waiting = self._ser.in_waiting
+        if not waiting:
+            return ""
+        return self._ser.read(waiting).decode(errors="ignore").strip()
+
+    def _echo_ack(self) -> None:
+        """Print whatever the Arduino sent back (diagnostic mode only)."""
+        ack = self._rx()
+        if ack:
+            print("Arduino:", ack)
 
     # ------------------------------------------------------------------
     # High‑level commands used by the rest of the project
     # ------------------------------------------------------------------
     def write_angle(self, angle: int) -> None:  # noqa: D401 – public API
-        """Send a vertical‑servo angle (degrees)."""
-        self._tx(f"A,{angle}\n")
-        ack = self._rx()
-        if ack:
-            print("Arduino:", ack)
+        """Send a vertical‑servo angle (degrees); repeats are skipped."""
+        if angle == self._last_angle:
+            return
+        self._last_angle = angle
+        self._tx(b"A,%d\n" % angle)
+        if self.echo_acks:
+            self._echo_ack()
 
     def write_wheels(self, upper_pwm: int, lower_pwm: int) -> None:  # noqa: D401
         """Set dual‑wheel speeds (0–255) in one shot."""
-        self._tx(f"W,{upper_pwm},{lower_pwm}\n")
-        ack = self._rx()
-        if ack:
-            print("Arduino:", ack)
+        self._tx(b"W,%d,%d\n" % (upper_pwm, lower_pwm))
+        if self.echo_acks:
+            self._echo_ack()
 
     def write_gate(self, open_flag: bool) -> None:  # noqa: D401 – toggle gate
         """Open (`True`) or close (`False`) the gate."""
-        self._tx(f"G,{1 if open_flag else 0}\n")
-        ack = self._rx()
-        if ack:
-            print("Arduino:", ack)
+        self._tx(b"G,1\n" if open_flag else b"G,0\n")
+        if self.echo_acks:
+            self._echo_ack()
 
     # Backwards‑compat alias – some modules call write_raw directly
-    def write_raw(self, msg: str) -> None:  # noqa: D401 – wrapper
+    def write_raw(self, msg: str | bytes) -> None:  # noqa: D401 – wrapper
         self._tx(msg)
\ No newline at end of file
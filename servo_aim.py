@@ -1,10 +1,86 @@
 from __future__ import annotations
 
+import math
 import random
 import time
 from typing import Optional, Tuple
 
-from utils import clamp, map_to_servo_angle, calculate_servo_point
+import numpy as np
+
+from utils import clamp, calculate_servo_point, njit
+
+
+@njit(cache=True)
+def _build_angle_lut(width: int, min_angle: int, max_angle: int) -> np.ndarray:
+    """FOLLOW-mode table: entry *x* is the servo angle for pixel column *x*.
+
+    Same maths as :func:`utils.map_to_servo_angle`, evaluated once for
+    every column so the per-frame work is a single index.  Compiled by
+    Numba when it is installed.
+    """
+    lut = np.empty(width + 1, np.int16)
+    scale = (max_angle - min_angle) / width
+    for x in range(width + 1):
+        raw = min_angle + x * scale
+        if raw < min_angle:
+            raw = min_angle
+        elif raw > max_angle:
+            raw = max_angle
+        lut[x] = int(raw)
+    return lut
+
+
+@njit(cache=True)
+def _one_euro_step(
+    x: float, dt: float, x_prev: float, dx_prev: float,
+    min_cutoff: float, beta: float, d_cutoff: float,
+) -> Tuple[float, float]:
+    """One filter step; returns the new ``(x, dx)``.
+
+    Kept free of Python objects so Numba can compile it when installed.
+    """
+    tau_d = 1.0 / (2 * math.pi * d_cutoff)
+    a_d = 1.0 / (1.0 + tau_d / dt)
+    dx = a_d * (x - x_prev) / dt + (1 - a_d) * dx_prev
+    tau = 1.0 / (2 * math.pi * (min_cutoff + beta * abs(dx)))
+    a = 1.0 / (1.0 + tau / dt)
+    return a * x + (1 - a) * x_prev, dx
+
+
+class OneEuroFilter:
+    """One Euro filter (Casiez et al.) for a single scalar signal.
+
+    Heavy smoothing while the signal is still, little lag once it moves –
+    the cutoff rises with the filtered speed.  Cheap enough to run on
+    every frame, which is why MediaPipe's own smoother is switched off.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.01, d_cutoff: float = 1.0) -> None:
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self) -> None:
+        self._x: Optional[float] = None
+        self._dx = 0.0
+        self._t = 0.0
+
+    def __call__(self, x: float, t: float) -> float:
+        if self._x is None:
+            # float from the start: an int here would make Numba compile
+            # _one_euro_step a second time for the int signature
+            self._x, self._t = float(x), t
+            return self._x
+        dt = t - self._t
+        if dt <= 0:
+            return self._x
+        self._t = t
+        self._x, self._dx = _one_euro_step(
+            float(x), dt, self._x, self._dx,
+            self.min_cutoff, self.beta, self.d_cutoff,
+        )
+        return self._x
 
 
 class Mode:
@@ -28,6 +104,15 @@ class ServoAimer:
 
         self.current_angle: int = (min_angle + max_angle) // 2
         self._next_random_time: float = 0.0
+        self._waist_filter = OneEuroFilter()
+
+        # pixel -> angle table, rebuilt when width or limits change
+        self._lut: Optional[np.ndarray] = None
+        self._lut_key: Optional[Tuple[int, int, int]] = None
+
+        # draw_arrow() only recomputes the end point when something moved
+        self._arrow_key: Optional[Tuple[int, int, int, int]] = None
+        self._arrow_end: Tuple[int, int] = (0, 0)
 
     # --------------------------------------------------------------
     # Public helpers
@@ -47,13 +132,14 @@ class ServoAimer:
             if waist_x is None:
                 # lost the player -> centre
                 self.current_angle = (self.min_angle + self.max_angle) // 2
+                self._waist_filter.reset()
             else:
-                self.current_angle = map_to_servo_angle(
-                    waist_x,
-                    frame_width,
-                    min_angle=self.min_angle,
-                    max_angle=self.max_angle,
-                )
+                waist_x = self._waist_filter(waist_x, now)
+                key = (frame_width, self.min_angle, self.max_angle)
+                if key != self._lut_key:
+                    self._lut = _build_angle_lut(*key)
+                    self._lut_key = key
+                self.current_angle = int(self._lut[int(clamp(waist_x, 0, frame_width))])
             return self.current_angle
 
         # ---------------- RANDOM ----------------
@@ -80,7 +166,10 @@ class ServoAimer:
         """Draw a green arrow reflecting the current angle."""
         import cv2
 
-        end = calculate_servo_point(base_x, base_y, self.current_angle, length)
-        cv2.arrowedLine(img, (base_x, base_y), end, (0, 255, 0), 5)
+        key = (base_x, base_y, self.current_angle, length)
+        if key != self._arrow_key:
+            self._arrow_key = key
+            self._arrow_end = calculate_servo_point(base_x, base_y, self.current_angle, length)
+        cv2.arrowedLine(img, (base_x, base_y), self._arrow_end, (0, 255, 0), 5)
         cv2.circle(img, (base_x, base_y), 8, (255, 0, 0), -1)
 
@@ -7,18 +7,59 @@ few one‑liners everywhere else.
 from __future__ import annotations
 
 import math
+import time
+from functools import lru_cache, wraps
 from typing import Tuple
 
 import cv2  # OpenCV is already a project dependency
+import numpy as np
+
+def _lazy_njit(fn, options: dict):
+    """Wrap *fn* so Numba is imported and compiles it on the first call."""
+    impl = None
+
+    @wraps(fn)
+    def kernel(*args, **kwargs):
+        nonlocal impl
+        if impl is None:
+            try:
+                from numba import njit as numba_njit  # type: ignore
+                impl = numba_njit(**options)(fn)
+            except ImportError:  # pragma: no cover – numba is an optional speed-up
+                impl = fn
+        return impl(*args, **kwargs)
+
+    return kernel
+
+
+def njit(*args, **kwargs):
+    """Lazy stand-in for :func:`numba.njit`.
+
+    Importing Numba costs noticeable startup time, so it is deferred until
+    a decorated kernel first runs; without Numba the plain function runs.
+    The wrapper is Python, so jitted kernels cannot call one another.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return _lazy_njit(args[0], {})
+    return lambda fn: _lazy_njit(fn, kwargs)
 
 __all__ = [
     "pad_square",
+    "SquarePadder",
     "clamp",
     "map_value",
+    "make_mapper",
     "map_to_servo_angle",
+    "map_to_servo_angles",
     "calculate_servo_point",
+    "calculate_servo_points",
+    "frame_to_servo",
+    "grab_latest",
     "find_camera_index",
     "find_serial_port",
+    "list_camera_indices",
+    "list_serial_ports",
+    "njit",
 ]
 
 
@@ -26,30 +67,97 @@ __all__ = [
 # Image helpers
 # ----------------------------------------------------------------------
 
-def pad_square(image, colour: Tuple[int, int, int] = (0, 0, 0)):
+def pad_square(image, colour: Tuple[int, int, int] = (0, 0, 0), tolerance: int = 0):
     """Return *image* padded to a square canvas.
 
     OpenCV frames are numpy arrays shaped (h, w, 3).  If the width and
     height differ we add borders so that the result is a square, using the
     supplied *colour* (BGR order).  This keeps the subject centred and makes
     later math easier because *width* equals *height*.
+
+    The canvas is reused between calls with the same size, dtype and
+    colour (see :class:`SquarePadder`), so the result is overwritten by the
+    next such call – copy it if you need to keep it.
+
+    When the sides differ by at most *tolerance* pixels the longer one is
+    cropped instead (centred), returning a view of *image* – no copy.
     """
     h, w = image.shape[:2]
     if h == w:
         return image
+    if abs(h - w) <= tolerance:
+        m = min(h, w)
+        top, left = (h - m) // 2, (w - m) // 2
+        return image[top:top + m, left:left + m]
+
+    channels = image.shape[2] if image.ndim == 3 else 1
+    if channels > len(colour):
+        # colour doesn't cover every channel – let OpenCV zero-fill the rest
+        size = max(h, w)
+        top = (size - h) // 2
+        bottom = size - h - top
+        left = (size - w) // 2
+        right = size - w - left
+        return cv2.copyMakeBorder(image, top, bottom, left, right, cv2.BORDER_CONSTANT, value=colour)
+    return _shared_padder(h, w, tuple(colour), channels, image.dtype)(image)
+
+
+@lru_cache(maxsize=8)
+def _shared_padder(h: int, w: int, colour: tuple, channels: int, dtype) -> "SquarePadder":
+    """One single-buffer :class:`SquarePadder` per frame geometry."""
+    return SquarePadder(h, w, colour, channels=channels, dtype=dtype, buffers=1)
+
+
+class SquarePadder:
+    """:func:`pad_square` for a stream of equally sized frames.
+
+    The border geometry is worked out once and the square canvases are
+    allocated (and painted with *colour*) up front, so every call is just
+    a blit of the live frame into the centre – no allocation, no re‑fill.
+
+    The returned array belongs to the padder and is overwritten again
+    *buffers* calls later; copy it if you need to keep it longer.
+    """
+
+    def __init__(
+        self,
+        h: int,
+        w: int,
+        colour: Tuple[int, int, int] = (0, 0, 0),
+        *,
+        channels: int = 3,
+        dtype=np.uint8,
+        buffers: int = 3,
+    ) -> None:
+        self.shape = (h, w)
+        size = max(h, w)
+        self._top = (size - h) // 2
+        self._left = (size - w) // 2
+
+        canvas = (size, size, channels) if channels > 1 else (size, size)
+        fill = colour[:channels] if channels > 1 else colour[0]
+        self._bufs = []
+        for _ in range(max(1, buffers)):
+            buf = np.empty(canvas, dtype)
+            buf[...] = fill
+            self._bufs.append(buf)
+        self._idx = 0
 
-    size = max(h, w)
-    top = (size - h) // 2
-    bottom = size - h - top
-    left = (size - w) // 2
-    right = size - w - left
-    return cv2.copyMakeBorder(image, top, bottom, left, right, cv2.BORDER_CONSTANT, value=colour)
+    def __call__(self, frame):
+        h, w = self.shape
+        if h == w:
+            return frame
+        buf = self._bufs[self._idx]
+        self._idx = (self._idx + 1) % len(self._bufs)
+        buf[self._top:self._top + h, self._left:self._left + w] = frame
+        return buf
 
 
 # ----------------------------------------------------------------------
 # Math helpers
 # ----------------------------------------------------------------------
 
+# clamp/map_value are kept for callers' convenience – prefer inlining in hot loops
 def clamp(value: float, low: float, high: float):
     """Clamp *value* into the inclusive range [low, high]."""
     return max(low, min(high, value))
@@ -66,23 +174,134 @@ def map_value(value: float, in_min: float, in_max: float, out_min: float, out_ma
     return out_min + ratio * (out_max - out_min)
 
 
+def make_mapper(in_min: float, in_max: float, out_min: float, out_max: float):
+    """Return a one‑argument :func:`map_value` for a fixed pair of ranges.
+
+    Scale and offset are worked out once, so each call is a single
+    multiply‑add instead of a subtract, divide and multiply.
+    """
+    if in_max == in_min:
+        raise ValueError("in_max and in_min cannot be equal – division by zero")
+    scale = (out_max - out_min) / (in_max - in_min)
+    offset = out_min - in_min * scale
+
+    def mapper(value: float) -> float:
+        return value * scale + offset
+
+    return mapper
+
+
 def map_to_servo_angle(x: int, width: int, *, min_angle: int = 0, max_angle: int = 180):
     """Map horizontal pixel *x* (0‒width) to a servo angle (*min_angle*‒*max_angle*)."""
-    raw = map_value(x, 0, width, min_angle, max_angle)
-    return int(clamp(raw, min_angle, max_angle))
+    # map_value + clamp inlined: two fewer Python calls per lookup
+    if width == 0:
+        raise ValueError("in_max and in_min cannot be equal – division by zero")
+    raw = min_angle + x * ((max_angle - min_angle) / width)
+    return int(min_angle if raw < min_angle else max_angle if raw > max_angle else raw)
+
+
+def map_to_servo_angles(xs, width: int, *, min_angle: int = 0, max_angle: int = 180) -> np.ndarray:
+    """Array version of :func:`map_to_servo_angle`; returns ``int16`` angles.
+
+    One NumPy pass for many x positions.  The scalar function stays pure
+    Python – for a single value that is cheaper than a round trip through
+    an array.
+    """
+    if width == 0:
+        raise ValueError("in_max and in_min cannot be equal – division by zero")
+    scale = (max_angle - min_angle) / width
+    raw = min_angle + np.asarray(xs, np.float64) * scale
+    return np.clip(raw, min_angle, max_angle).astype(np.int16)
+
+
+_DEG2RAD = math.pi / 180.0
+
+# cos/sin for every whole degree in [-360, 360]; index = degrees + _TRIG_SPAN
+_TRIG_SPAN = 360
+_COS = [math.cos(math.radians(a)) for a in range(-_TRIG_SPAN, _TRIG_SPAN + 1)]
+_SIN = [math.sin(math.radians(a)) for a in range(-_TRIG_SPAN, _TRIG_SPAN + 1)]
 
 
 def calculate_servo_point(base_x: int, base_y: int, angle_deg: float, length: int = 200):
     """Return the end‑point of a line starting at (base_x, base_y) heading
     *angle_deg* degrees counter‑clockwise from the +X axis.  Handy for drawing
     an arrow that shows where the physical servo should be pointing.
+
+    Whole‑degree angles come straight from a table; fractional ones are
+    interpolated between the two neighbouring entries.
     """
-    rad = math.radians(angle_deg)
-    end_x = int(base_x + length * math.cos(rad))
-    end_y = int(base_y - length * math.sin(rad))  # minus because image Y grows downward
+    a = angle_deg + _TRIG_SPAN
+    if 0 <= a < 2 * _TRIG_SPAN:
+        i = int(a)
+        cos_a, sin_a = _COS[i], _SIN[i]
+        frac = a - i
+        if frac:
+            cos_a += (_COS[i + 1] - cos_a) * frac
+            sin_a += (_SIN[i + 1] - sin_a) * frac
+    else:  # outside the table – rare, just use libm
+        rad = angle_deg * _DEG2RAD
+        cos_a, sin_a = math.cos(rad), math.sin(rad)
+    end_x = int(base_x + length * cos_a)
+    end_y = int(base_y - length * sin_a)  # minus because image Y grows downward
     return end_x, end_y
 
 
+def calculate_servo_points(base_x: int, base_y: int, angles_deg, length: int = 200) -> np.ndarray:
+    """Array version of :func:`calculate_servo_point`.
+
+    Returns an ``(N, 2)`` ``int32`` array of end points, one per angle.
+    ``.reshape(-1, 1, 2)`` gives, without copying, the layout
+    :func:`cv2.polylines` expects.
+    """
+    rad = np.asarray(angles_deg, np.float64) * _DEG2RAD
+    out = np.empty((rad.size, 2), np.int32)
+    out[:, 0] = base_x + length * np.cos(rad).ravel()
+    out[:, 1] = base_y - length * np.sin(rad).ravel()  # image Y grows downward
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def frame_to_servo(x: float, width: int, base_x: int, base_y: int, length: int = 200,
+                   min_angle: int = 0, max_angle: int = 180) -> Tuple[int, int, int]:
+    """:func:`map_to_servo_angle` then :func:`calculate_servo_point` in one call.
+
+    Returns ``(angle, end_x, end_y)``.  Compiled by Numba when it is
+    installed; otherwise plain Python with the same results.
+    """
+    raw = min_angle + x * ((max_angle - min_angle) / width)
+    if raw < min_angle:
+        raw = min_angle
+    elif raw > max_angle:
+        raw = max_angle
+    angle = int(raw)
+    rad = angle * _DEG2RAD
+    end_x = int(base_x + length * math.cos(rad))
+    end_y = int(base_y - length * math.sin(rad))
+    return angle, end_x, end_y
+
+
+# ----------------------------------------------------------------------
+# Device helpers
+# ----------------------------------------------------------------------
+
+def grab_latest(cap, *, max_grabs: int = 4, fresh_s: float = 0.005) -> bool:
+    """Advance *cap* to its newest frame, dropping any backlog.
+
+    Frames already sitting in the driver queue come back from ``grab()``
+    almost instantly, while a fresh one has to wait for the sensor.  So we
+    keep grabbing until one takes longer than *fresh_s* (or *max_grabs* is
+    hit).  Follow up with ``cap.retrieve()``; returns ``False`` when the
+    camera stops delivering.
+    """
+    for _ in range(max_grabs):
+        start = time.perf_counter()
+        if not cap.grab():
+            return False
+        if time.perf_counter() - start > fresh_s:
+            break
+    return True
+
+
 def find_camera_index(max_index: int = 4) -> int | None:
     """Return the first working camera index or ``None`` if none found."""
     for idx in range(max_index):
@@ -117,6 +336,43 @@ def find_serial_port(keyword: str = "Arduino") -> str | None:
     return None
 
 
+def list_camera_indices(max_index: int = 4) -> list[int]:
+    """Return every camera index below *max_index* that can be opened.
+
+    Probes each index in turn, so this can take a few seconds on some
+    platforms – call it from a worker thread in interactive code.
+    """
+    found = []
+    for idx in range(max_index):
+        cap = cv2.VideoCapture(idx)
+        if cap.isOpened():
+            found.append(idx)
+        cap.release()
+    return found
+
+
+def list_serial_ports(keyword: str = "Arduino") -> list[str]:
+    """Return the ``device`` names of all connected serial ports.
+
+    Ports whose description contains *keyword* (case-insensitive) are
+    listed first, so ``list_serial_ports()[0]`` is the best guess for the
+    launcher.  Returns an empty list when pySerial is not installed.
+    """
+    try:
+        from serial.tools.list_ports import comports
+    except Exception:
+        return []
+
+    matches, others = [], []
+    for info in comports():
+        try:
+            desc = info.description or ""
+        except Exception:
+            desc = ""
+        (matches if keyword.lower() in desc.lower() else others).append(info.device)
+    return matches + others
+
+
 # ----------------------------------------------------------------------
 # Quick demo when run directly (helpful in Jupyter)
 # ----------------------------------------------------------------------
@@ -3,20 +3,29 @@ wheel_controller.py
 ===================
 
 Handle the two shooter wheels.  Call set_spin('topspin'|'backspin'|'flat')
-then fire() to push a PWM pair to the Arduino.
+then fire() to push a PWM pair to the Arduino.  The PWM pair and its
+serial payload are worked out when the preset or base speeds change, so
+fire() only writes prebuilt bytes.
 
 Protocol:  "W,<upper_pwm>,<lower_pwm>\\n"
+           or, with binary=True, the 4-byte frame b"W" <upper> <lower> b"\\n"
+           (fixed length – the PWM bytes may themselves be 0x0A, so the
+           sketch must read 4 bytes rather than split on newlines)
 """
 
 from __future__ import annotations
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Tuple
 
 from serial_controller import SerialController
 
 
-@dataclass
+@dataclass(frozen=True)
 class SpinPreset:
+    # spelled out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("name", "ratio")
+
     name: str
     ratio: Tuple[float, float]  # (upper, lower) multipliers
 
@@ -25,10 +34,16 @@ class SpinPreset:
 FLAT      = SpinPreset("flat",     (1.0, 1.0))
 TOPSPIN   = SpinPreset("topspin",  (1.3, 1.0))
 BACKSPIN  = SpinPreset("backspin", (1.0, 1.3))
-_PRESETS  = {p.name: p for p in (FLAT, TOPSPIN, BACKSPIN)}
+_PRESETS  = MappingProxyType({p.name: p for p in (FLAT, TOPSPIN, BACKSPIN)})
 
 
 class WheelController:
+    __slots__ = (
+        "serial", "binary", "upper_base_pwm", "lower_base_pwm", "max_pwm",
+        "preset_name", "_up_mult", "_low_mult", "_up_pwm", "_low_pwm",
+        "_cached_payload",
+    )
+
     def __init__(
         self,
         serial: SerialController,
@@ -38,8 +53,12 @@ class WheelController:
         lower_pwm: int | None = None,
         max_pwm: int = 255,
         preset: str = "flat",
+        binary: bool = False,
     ) -> None:
         self.serial = serial
+        self.binary = binary  # needs a sketch that parses the 4-byte frame
+        # max_pwm and the base speeds are read by _recompute_pwms(); change
+        # the speeds through set_base_pwms() so the cached payload follows
         self.upper_base_pwm = upper_pwm if upper_pwm is not None else base_pwm
         self.lower_base_pwm = lower_pwm if lower_pwm is not None else base_pwm
         self.max_pwm = max_pwm
@@ -49,24 +68,44 @@ class WheelController:
     # Public controls
     # ------------------------------------------------------------------
     def set_spin(self, preset: str) -> None:
-        if preset not in _PRESETS:
-            raise ValueError(f"Unknown spin preset: {preset}")
-        self._preset = _PRESETS[preset]
+        try:
+            spin = _PRESETS[preset]
+        except KeyError:
+            raise ValueError(f"Unknown spin preset: {preset}") from None
+        # plain floats, so the PWM maths skips the preset/ratio lookups
+        self._up_mult, self._low_mult = spin.ratio
+        # plain string for HUDs/labels, refreshed only here
+        self.preset_name = preset
+        self._recompute_pwms()
 
     def set_base_pwms(self, upper_pwm: int, lower_pwm: int) -> None:
         """Set the base PWM values for the upper and lower wheels."""
         self.upper_base_pwm = upper_pwm
         self.lower_base_pwm = lower_pwm
+        self._recompute_pwms()
 
     def fire(self) -> None:
-        up_mult, low_mult = self._preset.ratio
-        up_pwm  = min(int(self.upper_base_pwm * up_mult),  self.max_pwm)
-        low_pwm = min(int(self.lower_base_pwm * low_mult), self.max_pwm)
-        self.serial.write_raw(f"W,{up_pwm},{low_pwm}\n")
+        self.serial.write_raw(self._cached_payload)
+
+    def fire_many(self, n: int) -> None:
+        """Queue *n* shots as a single serial write."""
+        if n > 0:
+            self.serial.write_raw(self._cached_payload * n)
 
     def current_pwms(self) -> Tuple[int, int]:
-        up_mult, low_mult = self._preset.ratio
-        return (
-            min(int(self.upper_base_pwm * up_mult),  self.max_pwm),
-            min(int(self.lower_base_pwm * low_mult), self.max_pwm),
-        )
+        return self._up_pwm, self._low_pwm
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+    def _recompute_pwms(self) -> None:
+        """Recompute the PWM pair and the bytes fire() sends."""
+        self._up_pwm  = up_pwm  = min(int(self.upper_base_pwm * self._up_mult),  self.max_pwm)
+        self._low_pwm = low_pwm = min(int(self.lower_base_pwm * self._low_mult), self.max_pwm)
+        if self.binary:
+            # one byte per PWM – clamp so odd bases / max_pwm > 255 can't raise
+            self._up_pwm  = up_pwm  = 0 if up_pwm  < 0 else 255 if up_pwm  > 255 else up_pwm
+            self._low_pwm = low_pwm = 0 if low_pwm < 0 else 255 if low_pwm > 255 else low_pwm
+            self._cached_payload = bytes((0x57, up_pwm, low_pwm, 0x0A))  # W..\n
+        else:
+            self._cached_payload = b"W,%d,%d\n" % (up_pwm, low_pwm)